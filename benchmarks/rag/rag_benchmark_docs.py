@@ -49,11 +49,21 @@ import json
 import logging
 import os
 import random
+import re
 import time
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 # Configure logging
@@ -62,8 +72,134 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Question generation prompt, filled per document node
+QUESTION_KINDS = {
+    0: "closed-ended (factual, specific answer)",
+    1: "open-ended (comprehension, analysis)",
+}
+QUESTION_PROMPT_TEMPLATE = """Based on this short text excerpt, generate exactly 1 {question_kind} question with its answer.
+
+IMPORTANT: This is a short excerpt from a larger document. Ask about specific facts/concepts mentioned in THIS excerpt only.
+
+Text excerpt:
+{node_text}
+
+Format your response as JSON:
+{{
+    "question": "...",
+    "answer": "..."
+}}
+"""
+
+# Judge scoring prompts: strict 0/5/10 for closed questions, 0-10 for open ones.
+# The indentation is part of the prompt text and is kept so scores stay
+# comparable with earlier runs
+CLOSED_SCORE_PROMPT_TEMPLATE = """Score this factual answer using STRICT criteria:
+            - Give 10 points if the answer is COMPLETELY CORRECT with all key facts matching
+            - Give 5 points if the answer is PARTIALLY CORRECT (has some correct facts but missing important details)
+            - Give 0 points if the answer is WRONG or completely misses the point
+            
+            Question: {question}
+            Ground Truth Answer: {ground_truth}
+            Provided Answer: {answer}
+            
+            This is a CLOSED-ENDED factual question. Be strict - if the core fact is wrong, give 0.
+            Respond with only a number: 0, 5, or 10."""
+OPEN_SCORE_PROMPT_TEMPLATE = """Score this analytical answer on a scale of 0-10 considering:
+            - Accuracy (3 points): Are the facts and concepts correct?
+            - Completeness (3 points): Does it cover the main points from the ground truth?
+            - Understanding (2 points): Does it show comprehension of the topic?
+            - Relevance (2 points): Does it directly address the question?
+            
+            Question: {question}
+            Ground Truth Answer: {ground_truth}
+            Provided Answer: {answer}
+            
+            This is an OPEN-ENDED analytical question. Provide a nuanced score from 0-10.
+            Respond with only a number from 0 to 10."""
+
+# Service call timeouts in seconds. Connecting is never retried, so an
+# unreachable endpoint fails fast; unless --max-total-time is given, the
+# per-service read timeouts double as the total budget for a call across
+# retries, so retries never compound
+CONNECT_TIMEOUT = 10
+DOCUMENTS_TIMEOUT = 60
+QUESTION_TIMEOUT = 60
+RAG_TIMEOUT = 60
+JUDGE_TIMEOUT = 180
+LLM_TIMEOUT = 3000  # Very long timeout for LLM with reasoning
+
+# Quality thresholds for document nodes used as question sources
+MIN_NODE_CHARS = 200
+MIN_NODE_WORDS = 30
+MAX_AVG_WORD_LENGTH = 15  # longer averages usually mean tables or encoded data
+
+# Judge score extraction, compiled once and tried in order of specificity
+SCORE_PATTERNS = [
+    # "Score: 8" or "Final score: 10"
+    re.compile(r"(?:final\s*)?score\s*[:=]\s*(\d+(?:\.\d+)?)", re.IGNORECASE),
+    # "8 out of 10" or "8/10"
+    re.compile(r"(\d+(?:\.\d+)?)\s*(?:out of|/)\s*10", re.IGNORECASE),
+    # "rating is 8" or "score is 8"
+    re.compile(r"(?:rating|score).*?(\d+(?:\.\d+)?)", re.IGNORECASE),
+]
+NUMBER_PATTERN = re.compile(r"\b(\d+(?:\.\d+)?)\b")
+
+# Human-readable report layout, filled from BenchmarkReport fields
+TEXT_REPORT_TEMPLATE = """\
+RAG vs LLM Benchmark Report
+==================================================
+
+Total Questions: {total_questions}
+
+Average Scores (0-10):
+  RAG Overall: {rag_avg_score:.2f}
+  LLM Overall: {llm_avg_score:.2f}
+  Performance Improvement: {performance_improvement:.1f}%
+
+Closed Questions (0/5/10 scoring - factual accuracy):
+  RAG: {rag_closed_avg:.2f}
+  LLM: {llm_closed_avg:.2f}
+
+Open Questions (0-10 scoring - comprehensive evaluation):
+  RAG: {rag_open_avg:.2f}
+  LLM: {llm_open_avg:.2f}
+
+Token Usage:
+  RAG: {rag_total_tokens:,} tokens
+  LLM: {llm_total_tokens:,} tokens
+  Efficiency: {token_efficiency:.1f}% {efficiency_label} tokens with RAG
+"""
+
+
+def extract_json_object(text: str) -> dict | None:
+    """
+    Extract the first JSON object embedded in free-form LLM output
+
+    Decodes from each "{" in turn and stops at the first complete object,
+    so trailing prose or stray braces after the object are never scanned.
+
+    Args:
+        text: Raw model output
+
+    Returns:
+        The decoded object, or None if no JSON object is found
+    """
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(obj, dict):
+                return obj
+        start = text.find("{", start + 1)
+    return None
+
 
-@dataclass
+@dataclass(slots=True)
 class TestQuestion:
     """Test question with ground truth answer"""
 
@@ -73,7 +209,7 @@ class TestQuestion:
     question_type: str  # "closed" or "open"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result for a single test question"""
 
@@ -86,7 +222,7 @@ class TestResult:
     llm_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkReport:
     """Final benchmark report"""
 
@@ -115,6 +251,11 @@ class RAGBenchmark:
         judge_model: str = "gpt-4",
         llm_api_key: str | None = None,
         judge_api_key: str | None = None,
+        max_workers: int = 1,
+        request_timeout: float | None = None,
+        llm_timeout: float | None = None,
+        max_retries: int = 0,
+        max_total_time: float | None = None,
     ):
         """
         Initialize benchmark with service URLs
@@ -127,14 +268,34 @@ class RAGBenchmark:
             judge_model: Model name for Judge LLM (default: gpt-4)
             llm_api_key: API key for LLM service
             judge_api_key: API key for Judge LLM service
+            max_workers: Number of questions generated and tested concurrently
+                (default: 1)
+            request_timeout: Read timeout in seconds for document, question, RAG
+                and judge calls (default: per-service defaults)
+            llm_timeout: Read timeout in seconds for pure LLM calls
+                (default: 3000)
+            max_retries: Times to retry a call whose read timed out (default: 0)
+            max_total_time: Total time in seconds a call may spend across all
+                of its attempts (default: the call's read timeout)
         """
         self.rag_url = rag_url.rstrip("/")
         self.llm_url = llm_url.rstrip("/")
         self.judge_llm_url = judge_llm_url.rstrip("/")
+
+        # Chat completion endpoints are fixed for the lifetime of the benchmark
+        self.rag_chat_url = f"{self.rag_url}/v1/chat/completions"
+        self.llm_chat_url = f"{self.llm_url}/v1/chat/completions"
+        self.judge_chat_url = f"{self.judge_llm_url}/v1/chat/completions"
+
         self.llm_model = llm_model
         self.judge_model = judge_model
         self.llm_api_key = llm_api_key or os.getenv("LLM_API_KEY")
         self.judge_api_key = judge_api_key or os.getenv("JUDGE_API_KEY")
+        self.max_workers = max_workers
+        self.request_timeout = request_timeout
+        self.llm_timeout = llm_timeout
+        self.max_retries = max_retries
+        self.max_total_time = max_total_time
         self.index_name = None
         self.test_questions: list[TestQuestion] = []
         self.test_results: list[TestResult] = []
@@ -143,6 +304,13 @@ class RAGBenchmark:
         self.llm_headers = self._prepare_headers(self.llm_api_key)
         self.judge_headers = self._prepare_headers(self.judge_api_key)
 
+        # Share keep-alive connections across all calls; size the pool so
+        # concurrent workers querying RAG and LLM side by side never block
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max(2 * max_workers, 10))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def _prepare_headers(self, api_key: str | None) -> dict[str, str]:
         """Prepare headers with API key if provided"""
         headers = {"Content-Type": "application/json"}
@@ -150,6 +318,60 @@ class RAGBenchmark:
             headers["Authorization"] = f"Bearer {api_key}"
         return headers
 
+    def _request(
+        self,
+        method: str,
+        url: str,
+        default_timeout: float,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Call a service through the shared session, retrying slow reads
+
+        Only read timeouts are retried; connection failures surface at once.
+        All attempts share a total budget of max_total_time when set, and
+        otherwise of the larger of default_timeout and the configured timeout,
+        so retries never stretch a call past the time a single attempt was
+        already allowed. Retries therefore only happen at the default budget
+        when the per-attempt read timeout is shorter than it.
+
+        Args:
+            method: HTTP method
+            url: Endpoint to call
+            default_timeout: Per-service read timeout and default time budget
+            timeout: Configured read timeout overriding default_timeout
+            **kwargs: Extra arguments passed to requests.Session.request
+
+        Returns:
+            The response of the first attempt that did not time out
+        """
+        read_timeout = timeout or default_timeout
+        budget = self.max_total_time or max(default_timeout, read_timeout)
+        deadline = time.monotonic() + budget
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return self.session.request(
+                    method,
+                    url,
+                    timeout=(CONNECT_TIMEOUT, min(read_timeout, remaining)),
+                    **kwargs,
+                )
+            except requests.ReadTimeout:
+                remaining = deadline - time.monotonic()
+                if attempt >= self.max_retries or remaining <= 0:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "Request to %s timed out, retrying (%d/%d, %.0fs left)",
+                    url,
+                    attempt,
+                    self.max_retries,
+                    remaining,
+                )
+
     def is_rich_node(self, text: str) -> bool:
         """
         Check if node has rich content based on quality criteria
@@ -160,20 +382,19 @@ class RAGBenchmark:
         Returns:
             True if node meets quality standards
         """
-        if not text or not text.strip():
+        if not text:
             return False
 
         text = text.strip()
         char_count = len(text)
-        words = text.split()
-        word_count = len(words)
 
-        # Apply quality criteria
-        if char_count < 200:
+        # Apply quality criteria, cheapest first
+        if char_count < MIN_NODE_CHARS:
             return False
-        if word_count < 30:
+        word_count = len(text.split())
+        if word_count < MIN_NODE_WORDS:
             return False
-        return not (word_count > 0 and (char_count / word_count) >= 15)
+        return (char_count / word_count) < MAX_AVG_WORD_LENGTH
 
     def generate_test_questions(
         self, num_closed: int = 10, num_open: int = 10
@@ -188,7 +409,10 @@ class RAGBenchmark:
         """
         total_questions = num_closed + num_open
         logger.info(
-            f"Generating {num_closed} closed and {num_open} open questions from index '{self.index_name}'"
+            "Generating %d closed and %d open questions from index '%s'",
+            num_closed,
+            num_open,
+            self.index_name,
         )
 
         # Step 1: Retrieve all document nodes from RAG index (with pagination)
@@ -198,8 +422,11 @@ class RAGBenchmark:
         limit = 100  # API max limit
 
         while True:
-            response = requests.get(
+            response = self._request(
+                "GET",
                 f"{self.rag_url}/indexes/{self.index_name}/documents",
+                DOCUMENTS_TIMEOUT,
+                self.request_timeout,
                 params={"limit": limit, "offset": offset},
             )
 
@@ -218,7 +445,7 @@ class RAGBenchmark:
             if len(batch) < limit:
                 break  # Last page
 
-        logger.info(f"Retrieved {len(all_nodes)} nodes from index")
+        logger.info("Retrieved %d nodes from index", len(all_nodes))
 
         if len(all_nodes) == 0:
             raise Exception(f"No documents found in index '{self.index_name}'")
@@ -226,7 +453,9 @@ class RAGBenchmark:
         # Step 2: Filter content-rich nodes
         rich_nodes = [n for n in all_nodes if self.is_rich_node(n.get("text", ""))]
         logger.info(
-            f"Found {len(rich_nodes)} content-rich nodes out of {len(all_nodes)} total nodes"
+            "Found %d content-rich nodes out of %d total nodes",
+            len(rich_nodes),
+            len(all_nodes),
         )
 
         if len(rich_nodes) == 0:
@@ -252,17 +481,21 @@ class RAGBenchmark:
                     node_assignments[idx] = (node, num_q + 1)
 
             logger.info(
-                f"Case A: {len(rich_nodes)} nodes ≤ {total_questions} questions"
+                "Case A: %d nodes ≤ %d questions", len(rich_nodes), total_questions
             )
             logger.info(
-                f"Base: {base_questions_per_node} q/node, Remainder: {remainder} extra questions"
+                "Base: %d q/node, Remainder: %d extra questions",
+                base_questions_per_node,
+                remainder,
             )
         else:
             # Case B: N > 20 - randomly select 20 nodes
             selected_nodes = random.sample(rich_nodes, total_questions)
             node_assignments = [(node, 1) for node in selected_nodes]
             logger.info(
-                f"Case B: Randomly selected {total_questions} nodes from {len(rich_nodes)} rich nodes"
+                "Case B: Randomly selected %d nodes from %d rich nodes",
+                total_questions,
+                len(rich_nodes),
             )
 
         # Step 4: Randomly assign question types
@@ -280,104 +513,111 @@ class RAGBenchmark:
         node_type_pairs = list(zip(flattened_assignments, question_types))
         random.shuffle(node_type_pairs)  # Additional shuffle for randomness
 
-        logger.info(f"Created {len(node_type_pairs)} node-question-type assignments")
+        logger.info("Created %d node-question-type assignments", len(node_type_pairs))
+
+        # Step 5: Generate questions for each node, overlapping the LLM round
+        # trips across workers; results are collected in assignment order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            generated = list(
+                tqdm(
+                    executor.map(
+                        lambda pair: self.generate_question(*pair), node_type_pairs
+                    ),
+                    total=len(node_type_pairs),
+                    desc="Generating questions",
+                )
+            )
 
-        # Step 5: Generate questions for each node
-        question_id = 0
-        for node, q_type in tqdm(node_type_pairs, desc="Generating questions"):
-            question_type_name = "closed" if q_type == 0 else "open"
-            node_text = node.get("text", "")
+        for (_, q_type), question_data in zip(node_type_pairs, generated):
+            if question_data is None:
+                continue
 
-            # Generate single question for this node
-            prompt = f"""Based on this short text excerpt, generate exactly 1 {"closed-ended (factual, specific answer)" if q_type == 0 else "open-ended (comprehension, analysis)"} question with its answer.
+            self.test_questions.append(
+                TestQuestion(
+                    id=len(self.test_questions),
+                    question=question_data.get("question", ""),
+                    answer=question_data.get("answer", ""),
+                    question_type="closed" if q_type == 0 else "open",
+                )
+            )
 
-IMPORTANT: This is a short excerpt from a larger document. Ask about specific facts/concepts mentioned in THIS excerpt only.
+        logger.info(
+            "Successfully generated %d test questions", len(self.test_questions)
+        )
 
-Text excerpt:
-{node_text[:2000]}
+        # Verify we have the right distribution
+        type_counts = Counter(q.question_type for q in self.test_questions)
+        logger.info(
+            "Final distribution: %d closed, %d open questions",
+            type_counts["closed"],
+            type_counts["open"],
+        )
 
-Format your response as JSON:
-{{
-    "question": "...",
-    "answer": "..."
-}}
-"""
+        return self.test_questions
 
-            try:
-                response = requests.post(
-                    f"{self.judge_llm_url}/v1/chat/completions",
-                    headers=self.judge_headers,
-                    json={
-                        "model": self.judge_model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "temperature": 0,
-                        "max_tokens": 10000,
-                    },
-                    timeout=60,
-                )
+    def generate_question(self, node: dict, q_type: int) -> dict | None:
+        """
+        Generate a single question/answer pair from a document node
 
-                if response.status_code != 200:
-                    logger.error(f"Failed to generate question: {response.text}")
-                    continue
+        Args:
+            node: Document node returned by the RAG index
+            q_type: 0 for a closed-ended question, 1 for an open-ended one
 
-                result = response.json()
-                message = result["choices"][0]["message"]
-                content = message.get("content", "") or message.get(
-                    "reasoning_content", ""
-                )
+        Returns:
+            Parsed question data, or None if generation failed
+        """
+        node_text = node.get("text", "")
 
-                if not content:
-                    logger.error("No content in response")
-                    continue
+        # Generate single question for this node
+        prompt = QUESTION_PROMPT_TEMPLATE.format(
+            question_kind=QUESTION_KINDS[q_type], node_text=node_text[:2000]
+        )
 
-                # Parse JSON response
-                import re
+        try:
+            response = self._request(
+                "POST",
+                self.judge_chat_url,
+                QUESTION_TIMEOUT,
+                self.request_timeout,
+                headers=self.judge_headers,
+                json={
+                    "model": self.judge_model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": 0,
+                    "max_tokens": 10000,
+                },
+            )
 
-                try:
-                    question_data = json.loads(content)
-                except json.JSONDecodeError:
-                    # Fallback: try to extract JSON
-                    json_match = re.search(r"\{.*\}", content, re.DOTALL)
-                    if json_match:
-                        try:
-                            question_data = json.loads(json_match.group())
-                        except json.JSONDecodeError:
-                            logger.error("Failed to parse JSON")
-                            continue
-                    else:
-                        logger.error("No JSON found")
-                        continue
-
-                # Add question
-                self.test_questions.append(
-                    TestQuestion(
-                        id=question_id,
-                        question=question_data.get("question", ""),
-                        answer=question_data.get("answer", ""),
-                        question_type=question_type_name,
-                    )
-                )
-                question_id += 1
+            if response.status_code != 200:
+                logger.error("Failed to generate question: %s", response.text)
+                return None
 
-                # Small delay to avoid rate limiting
-                time.sleep(0.3)
+            result = response.json()
+            message = result["choices"][0]["message"]
+            content = message.get("content", "") or message.get("reasoning_content", "")
 
-            except Exception as e:
-                logger.error(f"Error generating question: {e}")
-                continue
+            if not content:
+                logger.error("No content in response")
+                return None
 
-        logger.info(f"Successfully generated {len(self.test_questions)} test questions")
+            # Parse JSON response
+            try:
+                question_data = json.loads(content)
+            except json.JSONDecodeError:
+                # Fallback: try to extract JSON
+                question_data = extract_json_object(content)
+            if not isinstance(question_data, dict):
+                logger.error("No JSON object found")
+                return None
 
-        # Verify we have the right distribution
-        closed_count = sum(
-            1 for q in self.test_questions if q.question_type == "closed"
-        )
-        open_count = sum(1 for q in self.test_questions if q.question_type == "open")
-        logger.info(
-            f"Final distribution: {closed_count} closed, {open_count} open questions"
-        )
+            # Small delay to avoid rate limiting
+            time.sleep(0.3)
 
-        return self.test_questions
+            return question_data
+
+        except Exception as e:
+            logger.error("Error generating question: %s", e)
+            return None
 
     def query_rag(self, question: str) -> tuple[str, int]:
         """
@@ -387,8 +627,11 @@ Format your response as JSON:
             (answer, token_count)
         """
         # Query RAG system - modeled after rag_solution.py success
-        response = requests.post(
-            f"{self.rag_url}/v1/chat/completions",
+        response = self._request(
+            "POST",
+            self.rag_chat_url,
+            RAG_TIMEOUT,
+            self.request_timeout,
             headers={"Content-Type": "application/json"},
             json={
                 "model": self.llm_model,
@@ -404,7 +647,6 @@ Format your response as JSON:
                 "temperature": 0,
                 "max_tokens": 10000,
             },
-            timeout=60,
         )
 
         if response.status_code != 200:
@@ -435,8 +677,11 @@ Format your response as JSON:
         Returns:
             (answer, token_count)
         """
-        response = requests.post(
-            f"{self.llm_url}/v1/chat/completions",
+        response = self._request(
+            "POST",
+            self.llm_chat_url,
+            LLM_TIMEOUT,
+            self.llm_timeout,
             headers=self.llm_headers,
             json={
                 "model": self.llm_model,
@@ -444,7 +689,6 @@ Format your response as JSON:
                 "temperature": 0,
                 "max_tokens": 10000,
             },
-            timeout=3000,  # Very long timeout for LLM with reasoning
         )
 
         if response.status_code != 200:
@@ -485,34 +729,20 @@ Format your response as JSON:
         """
         if question_type == "closed":
             # Strict binary-like scoring for closed-ended questions
-            prompt = f"""Score this factual answer using STRICT criteria:
-            - Give 10 points if the answer is COMPLETELY CORRECT with all key facts matching
-            - Give 5 points if the answer is PARTIALLY CORRECT (has some correct facts but missing important details)
-            - Give 0 points if the answer is WRONG or completely misses the point
-            
-            Question: {question}
-            Ground Truth Answer: {ground_truth}
-            Provided Answer: {answer}
-            
-            This is a CLOSED-ENDED factual question. Be strict - if the core fact is wrong, give 0.
-            Respond with only a number: 0, 5, or 10."""
+            prompt = CLOSED_SCORE_PROMPT_TEMPLATE.format(
+                question=question, ground_truth=ground_truth, answer=answer
+            )
         else:
             # Gradient scoring for open-ended questions
-            prompt = f"""Score this analytical answer on a scale of 0-10 considering:
-            - Accuracy (3 points): Are the facts and concepts correct?
-            - Completeness (3 points): Does it cover the main points from the ground truth?
-            - Understanding (2 points): Does it show comprehension of the topic?
-            - Relevance (2 points): Does it directly address the question?
-            
-            Question: {question}
-            Ground Truth Answer: {ground_truth}
-            Provided Answer: {answer}
-            
-            This is an OPEN-ENDED analytical question. Provide a nuanced score from 0-10.
-            Respond with only a number from 0 to 10."""
+            prompt = OPEN_SCORE_PROMPT_TEMPLATE.format(
+                question=question, ground_truth=ground_truth, answer=answer
+            )
 
-        response = requests.post(
-            f"{self.judge_llm_url}/v1/chat/completions",
+        response = self._request(
+            "POST",
+            self.judge_chat_url,
+            JUDGE_TIMEOUT,
+            self.request_timeout,
             headers=self.judge_headers,
             json={
                 "model": self.judge_model,
@@ -520,11 +750,10 @@ Format your response as JSON:
                 "temperature": 0,
                 "max_tokens": 10000,  # Allow full reasoning output
             },
-            timeout=180,
         )
 
         if response.status_code != 200:
-            logger.error(f"Scoring failed: {response.text}")
+            logger.error("Scoring failed: %s", response.text)
             return 0.0
 
         result = response.json()
@@ -534,138 +763,205 @@ Format your response as JSON:
         ).strip()
 
         if not score_text:
-            logger.error(f"No content in Judge LLM scoring response: {message}")
+            logger.error("No content in Judge LLM scoring response: %s", message)
             return 0.0
 
-        # Extract numeric score from response (handle reasoning models that output verbose text)
-        import re
+        # Fast path: the judge was asked for a bare number, so check for a plain
+        # decimal first and only fall back to the regex strategies for verbose
+        # responses
+        if score_text[0].isdecimal() and score_text.replace(".", "", 1).isdecimal():
+            score = float(score_text)
+            if score <= 10:
+                return self._normalize_score(score, question_type)
 
+        # Extract numeric score from response (handle reasoning models that output verbose text)
         # Strategy 1: Look for explicit score patterns like "Score: 8" or "Final score: 10"
-        score_patterns = [
-            r"(?:final\s*)?score\s*[:=]\s*(\d+(?:\.\d+)?)",  # "Score: 8" or "Final score: 10"
-            r"(\d+(?:\.\d+)?)\s*(?:out of|/)\s*10",  # "8 out of 10" or "8/10"
-            r"(?:rating|score).*?(\d+(?:\.\d+)?)",  # "rating is 8" or "score is 8"
-        ]
-
-        for pattern in score_patterns:
-            matches = re.findall(pattern, score_text, re.IGNORECASE)
+        for pattern in SCORE_PATTERNS:
+            matches = pattern.findall(score_text)
             if matches:
                 try:
                     score = float(matches[-1])  # Use the last match
-                    logger.info(f"Extracted score {score} from pattern: {pattern}")
-                    # For closed questions, enforce 0/5/10 scoring
-                    if question_type == "closed":
-                        if score >= 8:
-                            return 10.0
-                        elif score >= 3:
-                            return 5.0
-                        else:
-                            return 0.0
-                    # For open questions, clamp to 0-10 range
-                    return min(max(score, 0.0), 10.0)
+                    logger.info(
+                        "Extracted score %s from pattern: %s", score, pattern.pattern
+                    )
+                    return self._normalize_score(score, question_type)
                 except (ValueError, IndexError):
                     continue  # Try next pattern
 
         # Strategy 2: Fallback - extract all numbers and use the last one in valid range
-        all_numbers = re.findall(r"\b(\d+(?:\.\d+)?)\b", score_text)
+        all_numbers = NUMBER_PATTERN.findall(score_text)
         for num in reversed(all_numbers):  # Check from end to start
             try:
                 score = float(num)
                 if 0 <= score <= 10:  # Must be valid score range
                     logger.info(
-                        f"Extracted score {score} from fallback (last valid number)"
+                        "Extracted score %s from fallback (last valid number)", score
                     )
-                    if question_type == "closed":
-                        if score >= 8:
-                            return 10.0
-                        elif score >= 3:
-                            return 5.0
-                        else:
-                            return 0.0
-                    return min(max(score, 0.0), 10.0)
+                    return self._normalize_score(score, question_type)
             except ValueError:
                 continue
 
-        logger.error(f"Could not extract valid score from: {score_text[:300]}")
+        logger.error("Could not extract valid score from: %s", score_text[:300])
         return 0.0
 
+    def _normalize_score(self, score: float, question_type: str) -> float:
+        """Map a raw judge score onto the scale used for the question type"""
+        # For closed questions, enforce 0/5/10 scoring
+        if question_type == "closed":
+            if score >= 8:
+                return 10.0
+            elif score >= 3:
+                return 5.0
+            else:
+                return 0.0
+        # For open questions, clamp to 0-10 range
+        return min(max(score, 0.0), 10.0)
+
     def run_benchmark(self) -> BenchmarkReport:
         """Run the full benchmark test"""
         logger.info("Starting benchmark tests")
 
-        for question in tqdm(self.test_questions, desc="Testing questions"):
-            # Query both systems
-            rag_answer, rag_tokens = self.query_rag(question.question)
-            llm_answer, llm_tokens = self.query_llm(question.question)
-
-            # Score both answers with question type awareness
-            rag_score = self.score_answer(
-                question.question, question.answer, rag_answer, question.question_type
-            )
-            llm_score = self.score_answer(
-                question.question, question.answer, llm_answer, question.question_type
-            )
+        # Questions are tested max_workers at a time; within each question the
+        # RAG and LLM calls share a second pool so they also run side by side
+        # instead of paying for both round trips sequentially
+        question_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        call_executor = ThreadPoolExecutor(max_workers=2 * self.max_workers)
+        results: list[TestResult | None] = [None] * len(self.test_questions)
+        remaining = iter(enumerate(self.test_questions))
+        pending = {}
+
+        def submit_next():
+            item = next(remaining, None)
+            if item is not None:
+                index, question = item
+                future = question_executor.submit(
+                    self.test_question, question, call_executor
+                )
+                pending[future] = index
+
+        try:
+            # Only max_workers questions are ever in flight, so a failure never
+            # leaves a backlog of queued questions still spending tokens
+            for _ in range(self.max_workers):
+                submit_next()
+            with tqdm(total=len(self.test_questions), desc="Testing questions") as bar:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                        bar.update()
+                        submit_next()
+        except BaseException:
+            # Abort on the first failed question, as the sequential loop did;
+            # calls already on the wire cannot be interrupted, so drop them
+            # instead of waiting up to their read timeout before re-raising
+            call_executor.shutdown(wait=False, cancel_futures=True)
+            question_executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            call_executor.shutdown()
+            question_executor.shutdown()
 
-            # Store results
-            result = TestResult(
-                question_id=question.id,
-                rag_answer=rag_answer,
-                llm_answer=llm_answer,
-                rag_score=rag_score,
-                llm_score=llm_score,
-                rag_tokens=rag_tokens,
-                llm_tokens=llm_tokens,
-            )
-            self.test_results.append(result)
-
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
+        self.test_results.extend(results)
 
         return self.generate_report()
 
-    def generate_report(self) -> BenchmarkReport:
-        """Generate final benchmark report"""
-        # Separate closed and open questions
-        closed_results = [
-            r
-            for r in self.test_results
-            if self.test_questions[r.question_id].question_type == "closed"
-        ]
-        open_results = [
-            r
-            for r in self.test_results
-            if self.test_questions[r.question_id].question_type == "open"
-        ]
+    def test_question(
+        self, question: TestQuestion, executor: ThreadPoolExecutor
+    ) -> TestResult:
+        """
+        Query and score both systems for a single question
 
-        # Calculate averages
-        rag_avg = sum(r.rag_score for r in self.test_results) / len(self.test_results)
-        llm_avg = sum(r.llm_score for r in self.test_results) / len(self.test_results)
+        Args:
+            question: Question to test
+            executor: Pool used to run the RAG and LLM calls concurrently
 
-        rag_closed_avg = (
-            sum(r.rag_score for r in closed_results) / len(closed_results)
-            if closed_results
-            else 0
-        )
-        llm_closed_avg = (
-            sum(r.llm_score for r in closed_results) / len(closed_results)
-            if closed_results
-            else 0
+        Returns:
+            Scored result for the question
+        """
+        # Query both systems
+        (rag_answer, rag_tokens), (llm_answer, llm_tokens) = self._gather(
+            executor.submit(self.query_rag, question.question),
+            executor.submit(self.query_llm, question.question),
         )
 
-        rag_open_avg = (
-            sum(r.rag_score for r in open_results) / len(open_results)
-            if open_results
-            else 0
+        # Score both answers with question type awareness
+        rag_future = executor.submit(
+            self.score_answer,
+            question.question,
+            question.answer,
+            rag_answer,
+            question.question_type,
+        )
+        llm_future = executor.submit(
+            self.score_answer,
+            question.question,
+            question.answer,
+            llm_answer,
+            question.question_type,
         )
-        llm_open_avg = (
-            sum(r.llm_score for r in open_results) / len(open_results)
-            if open_results
-            else 0
+        rag_score, llm_score = self._gather(rag_future, llm_future)
+
+        # Small delay to avoid rate limiting
+        time.sleep(0.5)
+
+        return TestResult(
+            question_id=question.id,
+            rag_answer=rag_answer,
+            llm_answer=llm_answer,
+            rag_score=rag_score,
+            llm_score=llm_score,
+            rag_tokens=rag_tokens,
+            llm_tokens=llm_tokens,
         )
 
-        # Token usage
-        rag_tokens = sum(r.rag_tokens for r in self.test_results)
-        llm_tokens = sum(r.llm_tokens for r in self.test_results)
+    def _gather(self, *futures: Future) -> list:
+        """
+        Wait for sibling futures, failing as soon as any of them fails
+
+        Siblings that have not started yet are cancelled so a failed RAG or LLM
+        call does not trigger further work for a question that is already lost.
+
+        Returns:
+            Results in the order the futures were given
+        """
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                for sibling in not_done:
+                    sibling.cancel()
+                future.result()
+        return [future.result() for future in futures]
+
+    def generate_report(self) -> BenchmarkReport:
+        """Generate final benchmark report"""
+        # Accumulate scores and token usage per question type in a single pass
+        rag_scores = {"closed": 0.0, "open": 0.0}
+        llm_scores = {"closed": 0.0, "open": 0.0}
+        counts = {"closed": 0, "open": 0}
+        rag_tokens = 0
+        llm_tokens = 0
+
+        for r in self.test_results:
+            question_type = self.test_questions[r.question_id].question_type
+            rag_scores[question_type] += r.rag_score
+            llm_scores[question_type] += r.llm_score
+            counts[question_type] += 1
+            rag_tokens += r.rag_tokens
+            llm_tokens += r.llm_tokens
+
+        # Calculate averages
+        total_results = len(self.test_results)
+        rag_avg = (rag_scores["closed"] + rag_scores["open"]) / total_results
+        llm_avg = (llm_scores["closed"] + llm_scores["open"]) / total_results
+
+        closed_count = counts["closed"]
+        rag_closed_avg = rag_scores["closed"] / closed_count if closed_count else 0
+        llm_closed_avg = llm_scores["closed"] / closed_count if closed_count else 0
+
+        open_count = counts["open"]
+        rag_open_avg = rag_scores["open"] / open_count if open_count else 0
+        llm_open_avg = llm_scores["open"] / open_count if open_count else 0
 
         # Performance improvement
         improvement = ((rag_avg - llm_avg) / llm_avg * 100) if llm_avg > 0 else 0
@@ -689,49 +985,70 @@ Format your response as JSON:
 
         return report
 
-    def save_results(self, output_dir: str = "benchmark_results"):
-        """Save all results to files"""
-        Path(output_dir).mkdir(exist_ok=True)
+    def save_results(
+        self,
+        output_dir: str = "benchmark_results",
+        report: BenchmarkReport | None = None,
+    ):
+        """
+        Save all results to files
+
+        Args:
+            output_dir: Directory to write results into
+            report: Report already produced by run_benchmark; generated if omitted
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
         timestamp = time.strftime("%Y%m%d_%H%M%S")
 
         # Save test questions
-        with open(f"{output_dir}/questions_{timestamp}.json", "w") as f:
+        with open(output_path / f"questions_{timestamp}.json", "w") as f:
             json.dump([asdict(q) for q in self.test_questions], f, indent=2)
 
         # Save test results
-        with open(f"{output_dir}/results_{timestamp}.json", "w") as f:
+        with open(output_path / f"results_{timestamp}.json", "w") as f:
             json.dump([asdict(r) for r in self.test_results], f, indent=2)
 
         # Save report
-        report = self.generate_report()
-        with open(f"{output_dir}/report_{timestamp}.json", "w") as f:
+        if report is None:
+            report = self.generate_report()
+        with open(output_path / f"report_{timestamp}.json", "w") as f:
             json.dump(asdict(report), f, indent=2)
 
         # Save human-readable report
-        with open(f"{output_dir}/report_{timestamp}.txt", "w") as f:
-            f.write("RAG vs LLM Benchmark Report\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Total Questions: {report.total_questions}\n\n")
-            f.write("Average Scores (0-10):\n")
-            f.write(f"  RAG Overall: {report.rag_avg_score:.2f}\n")
-            f.write(f"  LLM Overall: {report.llm_avg_score:.2f}\n")
+        efficiency_label = "fewer" if report.token_efficiency > 0 else "more"
+        with open(output_path / f"report_{timestamp}.txt", "w") as f:
             f.write(
-                f"  Performance Improvement: {report.performance_improvement:.1f}%\n\n"
-            )
-            f.write("Closed Questions (0/5/10 scoring - factual accuracy):\n")
-            f.write(f"  RAG: {report.rag_closed_avg:.2f}\n")
-            f.write(f"  LLM: {report.llm_closed_avg:.2f}\n\n")
-            f.write("Open Questions (0-10 scoring - comprehensive evaluation):\n")
-            f.write(f"  RAG: {report.rag_open_avg:.2f}\n")
-            f.write(f"  LLM: {report.llm_open_avg:.2f}\n\n")
-            f.write("Token Usage:\n")
-            f.write(f"  RAG: {report.rag_total_tokens:,} tokens\n")
-            f.write(f"  LLM: {report.llm_total_tokens:,} tokens\n")
-            f.write(
-                f"  Efficiency: {report.token_efficiency:.1f}% {'fewer' if report.token_efficiency > 0 else 'more'} tokens with RAG\n"
+                TEXT_REPORT_TEMPLATE.format(
+                    **asdict(report), efficiency_label=efficiency_label
+                )
             )
 
-        logger.info(f"Results saved to {output_dir}")
+        logger.info("Results saved to %s", output_dir)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts that may be 0"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """argparse type for durations in seconds that must be above 0"""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
 
 
 def main():
@@ -774,9 +1091,52 @@ def main():
     parser.add_argument(
         "--output-dir", default="benchmark_results", help="Output directory"
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of questions generated and tested concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=positive_float,
+        help="Read timeout in seconds for document, question, RAG and judge calls "
+        "(default: 60s, judge 180s)",
+    )
+    parser.add_argument(
+        "--llm-timeout",
+        type=positive_float,
+        help="Read timeout in seconds for pure LLM calls (default: 3000s)",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=non_negative_int,
+        default=0,
+        help="Times to retry a call whose read timed out, within the "
+        "--max-total-time budget (default: 0)",
+    )
+    parser.add_argument(
+        "--max-total-time",
+        type=positive_float,
+        help="Total seconds a call may spend across all retries "
+        "(default: the call's read timeout)",
+    )
 
     args = parser.parse_args()
 
+    # At the default budget the first attempt already uses the whole read
+    # timeout, so retries need a shorter timeout or a larger total budget
+    if (
+        args.max_retries
+        and args.max_total_time is None
+        and args.request_timeout is None
+        and args.llm_timeout is None
+    ):
+        logger.warning(
+            "--max-retries has no effect at the default timeouts; set "
+            "--max-total-time or a shorter --request-timeout/--llm-timeout"
+        )
+
     # Initialize benchmark with API keys and models
     benchmark = RAGBenchmark(
         args.rag_url,
@@ -786,11 +1146,16 @@ def main():
         args.judge_model,
         args.llm_api_key,
         args.judge_api_key,
+        max_workers=args.workers,
+        request_timeout=args.request_timeout,
+        llm_timeout=args.llm_timeout,
+        max_retries=args.max_retries,
+        max_total_time=args.max_total_time,
     )
 
     try:
         # Phase 1: Use existing index
-        logger.info(f"Using existing index: {args.index_name}")
+        logger.info("Using existing index: %s", args.index_name)
         benchmark.index_name = args.index_name
 
         # Phase 2: Generate test questions (fetch nodes from RAG index via API)
@@ -800,21 +1165,24 @@ def main():
         report = benchmark.run_benchmark()
 
         # Phase 4: Save results
-        benchmark.save_results(args.output_dir)
-
-        # Print summary
-        print("\n" + "=" * 50)
-        print("BENCHMARK COMPLETE")
-        print("=" * 50)
-        print(f"RAG Average Score: {report.rag_avg_score:.2f}/10")
-        print(f"LLM Average Score: {report.llm_avg_score:.2f}/10")
-        print(f"Performance Improvement: {report.performance_improvement:.1f}%")
-        print(f"Results saved to: {args.output_dir}")
+        benchmark.save_results(args.output_dir, report)
+
+        # Print summary as one block
+        separator = "=" * 50
+        print(
+            f"\n{separator}\n"
+            "BENCHMARK COMPLETE\n"
+            f"{separator}\n"
+            f"RAG Average Score: {report.rag_avg_score:.2f}/10\n"
+            f"LLM Average Score: {report.llm_avg_score:.2f}/10\n"
+            f"Performance Improvement: {report.performance_improvement:.1f}%\n"
+            f"Results saved to: {args.output_dir}"
+        )
 
         return 0
 
     except Exception as e:
-        logger.error(f"Benchmark failed: {e}")
+        logger.error("Benchmark failed: %s", e)
         return 1
 
 